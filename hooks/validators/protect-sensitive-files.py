@@ -64,6 +64,9 @@ where Claude Code does not populate the expected fields.
 CUSTOMIZATION:
 Modify PROTECTED_PATTERNS and PROTECTED_DIRECTORIES to customize what's blocked.
 The default configuration protects common credential and key file locations.
+These lists are the single source of truth for the policy: the sh port
+(protect-sensitive-files.sh) carries a copy that the test suite checks
+against them, so update both together.
 """
 
 # =============================================================================
@@ -71,11 +74,16 @@ The default configuration protects common credential and key file locations.
 # =============================================================================
 # We use only standard library modules to avoid dependency issues.
 # This script must run on any system with Python 3 installed.
+#
+# The hook is a fresh python3 process on every tool call, so module imports
+# are part of its latency. Keep this list short: json is imported inside
+# main() because only the CLI path parses a payload, and importing the
+# module for is_protected() alone should not pay for it.
 # =============================================================================
 
-import json          # For parsing the tool invocation payload from stdin
+import functools     # For memoizing is_protected() across repeated paths
+import re            # For the precompiled pattern matcher
 import sys           # For stdin, stderr, and exit codes
-from pathlib import Path  # Modern path handling (cross-platform)
 
 # =============================================================================
 # PROTECTED FILE PATTERNS
@@ -177,95 +185,130 @@ PROTECTED_DIRECTORIES = [
 ]
 
 
+# =============================================================================
+# COMPILED PATTERN MATCHERS
+# =============================================================================
+# The hook runs on every Read/Write/Edit, so the patterns are compiled once
+# per process instead of being re-parsed for every check. Compilation is
+# deferred to the first check (see _matchers()), so the fail-closed exits for
+# an empty or malformed payload never pay for it:
+# - Wildcard filename patterns ("*.pem", ".env.*") are matched against the
+#   filename with a single regex. Each alternative is wrapped in its own
+#   capturing group so m.lastindex tells us which pattern fired.
+# - Everything else (exact names and path fragments like ".aws/credentials")
+#   is checked as a substring of the normalized path, as it always has been.
+#   All fragments are joined into one regex so the path is scanned once by
+#   the C regex engine rather than once per fragment. A "*" inside a
+#   fragment ("gcloud/*.json") matches within a single path component.
+# - Protected directories and exact filenames live in frozensets, so the
+#   most common hits (.env, id_rsa, ...) are a single O(1) lookup that skips
+#   the regex and substring scans entirely.
+# =============================================================================
+_PROTECTED_DIRS = frozenset(PROTECTED_DIRECTORIES)
+_EXACT_NAMES = frozenset(p for p in PROTECTED_PATTERNS if "*" not in p and "/" not in p)
+_GLOB_PATTERNS = [p for p in PROTECTED_PATTERNS if "*" in p and "/" not in p]
+_SUBSTRING_PATTERNS = [p for p in PROTECTED_PATTERNS if p not in _GLOB_PATTERNS]
+
+# Precomputed union of fnmatch.translate() over _GLOB_PATTERNS, so the hook
+# never imports fnmatch or translates patterns at runtime. If you change a
+# wildcard pattern above, regenerate this literal with:
+#   "|".join(f"({fnmatch.translate(p)})" for p in _GLOB_PATTERNS)
+#       .replace("[\\s\\S]", "(?s:.)")
+# The replace keeps the any-character atom as a DOTALL "." should a Python
+# release emit the slower "[\s\S]" class. CPython 3.11-3.13 already emit
+# "(?s:...)" groups, so it is currently a no-op.
+# tests/test_protect_sensitive_files.py fails if the two drift apart.
+_GLOB_RE_SRC = (
+    r"((?s:\.env\..*)\Z)|((?s:.*\.pem)\Z)|((?s:.*\.key)\Z)"
+    r"|((?s:.*\.p12)\Z)|((?s:.*\.pfx)\Z)"
+)
+
+
+def _fragment_regex(pattern: str) -> str:
+    """Escape a path fragment for regex use, letting "*" match within a component."""
+    return "[^/]*".join(re.escape(piece) for piece in pattern.split("*"))
+
+
+@functools.cache
+def _matchers() -> tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the wildcard and path-fragment regexes on first use.
+
+    Returns:
+        Tuple of (glob regex over filenames, fragment regex over full paths)
+    """
+    glob_re = re.compile(_GLOB_RE_SRC)
+    substring_re = re.compile(
+        "|".join(f"({_fragment_regex(p)})" for p in _SUBSTRING_PATTERNS)
+    )
+    return glob_re, substring_re
+
+
 # =============================================================================
 # PATTERN MATCHING FUNCTION
 # =============================================================================
-def matches_pattern(filepath: str, pattern: str) -> bool:
+def matches_pattern(normalized: str, name: str) -> str | None:
     """
-    Check if a filepath matches the given pattern.
+    Find the protected pattern a file matches, if any.
 
-    This function implements simple glob-like pattern matching without
-    using the glob module. It handles common patterns used in file
-    protection rules.
+    Checks run cheapest and most likely first:
+        1. Exact filename lookup in a set (.env, id_rsa, ...) - O(1)
+        2. Wildcard patterns against the filename - one compiled regex
+        3. Exact names and path fragments anywhere in the path - one
+           regex search over the whole path
 
-    SUPPORTED PATTERNS:
-    - "*.extension": Matches files ending with .extension
-    - "name.*": Matches files starting with name.
-    - "exact": Exact filename match
-    - "path/component": Matches if pattern appears in path
+    The caller normalizes the path once and passes both forms in, so no
+    path is re-parsed or re-rendered here.
 
     Parameters:
-        filepath: The full path to the file being checked
-        pattern: The pattern to match against
+        normalized: The full path with backslashes replaced by "/"
+        name: The final component of the normalized path
 
     Returns:
-        True if the filepath matches the pattern, False otherwise
+        The first protected pattern that matches, or None
 
     Examples:
-        matches_pattern("/home/user/.env", ".env") -> True
-        matches_pattern("/app/config.json", "*.json") -> True
-        matches_pattern("/app/.aws/credentials", ".aws/credentials") -> True
+        matches_pattern("/home/user/.env", ".env") -> ".env"
+        matches_pattern("/app/server.pem", "server.pem") -> "*.pem"
+        matches_pattern("/app/.aws/credentials", "credentials") -> ".aws/credentials"
+        matches_pattern("/app/main.py", "main.py") -> None
     """
-    # Convert to Path object for easier manipulation
-    path = Path(filepath)
-    name = path.name  # Just the filename, not the full path
+    if name in _EXACT_NAMES:
+        return name
 
-    # =========================================================================
-    # PATTERN: *.extension
-    # =========================================================================
-    # Matches files by extension
-    # Example: "*.pem" matches "server.pem", "private.pem", etc.
-    # =========================================================================
-    if pattern.startswith("*."):
-        # Extract extension (including the dot)
-        # "*.pem" -> ".pem"
-        return name.endswith(pattern[1:])
+    glob_re, substring_re = _matchers()
 
-    # =========================================================================
-    # PATTERN: prefix.*
-    # =========================================================================
-    # Matches files starting with a prefix followed by a dot
-    # Example: ".env.*" matches ".env.local", ".env.production"
-    # =========================================================================
-    if pattern.endswith(".*"):
-        # Extract the base name
-        # ".env.*" -> ".env"
-        base = pattern[:-2]
-        return name.startswith(base + ".")
+    match = glob_re.match(name)
+    if match:
+        return _GLOB_PATTERNS[match.lastindex - 1]
 
-    # =========================================================================
-    # PATTERN: prefix*suffix
-    # =========================================================================
-    # Matches files with specific prefix and suffix
-    # This handles patterns like "credential*.json"
-    # =========================================================================
-    if "*" in pattern:
-        # Split on the wildcard
-        parts = pattern.split("*")
-        if len(parts) == 2:
-            return name.startswith(parts[0]) and name.endswith(parts[1])
+    match = substring_re.search(normalized)
+    if match:
+        return _SUBSTRING_PATTERNS[match.lastindex - 1]
 
-    # =========================================================================
-    # EXACT MATCH OR PATH COMPONENT
-    # =========================================================================
-    # Check for exact filename match or if the pattern appears
-    # anywhere in the path (for patterns like ".aws/credentials")
-    # =========================================================================
-    return name == pattern or pattern in str(path)
+    return None
 
 
 # =============================================================================
 # FILE PROTECTION CHECK FUNCTION
 # =============================================================================
-def is_protected(filepath: str) -> tuple[bool, str]:
+@functools.lru_cache(maxsize=256)
+def is_protected(filepath: "str | bytes | os.PathLike") -> tuple[bool, str]:
     """
     Check if a file is protected from access.
 
     This function checks both protected directories and protected file patterns.
     It returns a tuple indicating whether the file is protected and why.
 
+    The result depends only on the module-level pattern tables, so it is
+    memoized: a single hook call checks one path, but callers that import
+    this module to check many files get repeated paths for free.
+
     Parameters:
-        filepath: The path to check
+        filepath: The path to check. Callers importing this module may pass
+            a pathlib.Path (any os.PathLike) or bytes; these are decoded to
+            the same string the hook would see, as os.fsdecode() would,
+            without importing os or building a Path object.
 
     Returns:
         Tuple of (is_protected: bool, reason: str)
@@ -280,32 +323,45 @@ def is_protected(filepath: str) -> tuple[bool, str]:
     if not filepath:
         return False, ""
 
-    # Convert to Path and normalize for cross-platform compatibility
-    # Replace backslashes with forward slashes (Windows paths)
-    path = Path(filepath)
-    normalized = str(path).replace("\\", "/")
+    # Path-like and bytes arguments, decoded the way os.fsdecode() does
+    if not isinstance(filepath, str):
+        if hasattr(filepath, "__fspath__"):
+            filepath = filepath.__fspath__()
+        if isinstance(filepath, bytes):
+            filepath = filepath.decode(sys.getfilesystemencoding(),
+                                       sys.getfilesystemencodeerrors())
+
+    # Replace backslashes with forward slashes (Windows paths) so the path
+    # splits into the same components on every platform. Plain string
+    # splitting is much cheaper than constructing a pathlib.Path, and this
+    # runs on every tool call. Trailing slashes are stripped, as Path did,
+    # so "/app/x.pem/" still ends in the component "x.pem".
+    normalized = filepath.replace("\\", "/").rstrip("/")
 
     # =========================================================================
     # CHECK PROTECTED DIRECTORIES
     # =========================================================================
     # If the file is inside a protected directory, block it regardless
-    # of the filename.
+    # of the filename. Comparing whole path components means ".github"
+    # never matches ".git". isdisjoint() runs the membership test in C; only
+    # on a hit do we walk the parts again to name the outermost directory
+    # (set iteration order is not stable across runs).
     # =========================================================================
-    for protected_dir in PROTECTED_DIRECTORIES:
-        # Check if the protected directory appears in the path
-        # We add slashes to avoid partial matches (e.g., ".github" matching ".git")
-        # "/.git/" would match "/project/.git/config" but not "/project/.github/workflows"
-        if f"/{protected_dir}/" in f"/{normalized}/" or normalized.startswith(f"{protected_dir}/"):
-            return True, f"Directory '{protected_dir}' is protected"
+    parts = normalized.split("/")
+    if not _PROTECTED_DIRS.isdisjoint(parts):
+        part = next(p for p in parts if p in _PROTECTED_DIRS)
+        return True, f"Directory '{part}' is protected"
 
     # =========================================================================
     # CHECK PROTECTED FILE PATTERNS
     # =========================================================================
-    # Check if the filename matches any of our protected patterns
+    # Check if the filename matches any of our protected patterns. The
+    # normalized path and its last component are reused, not recomputed:
+    # parts[-1] is the basename, so no separate basename/rpartition step.
     # =========================================================================
-    for pattern in PROTECTED_PATTERNS:
-        if matches_pattern(filepath, pattern):
-            return True, f"File matches protected pattern '{pattern}'"
+    pattern = matches_pattern(normalized, parts[-1])
+    if pattern:
+        return True, f"File matches protected pattern '{pattern}'"
 
     # File is not protected
     return False, ""
@@ -345,6 +401,8 @@ def main():
               file=sys.stderr)
         sys.exit(1)
 
+    import json  # Deferred: only needed once there is a payload to parse
+
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError as e:
@@ -374,8 +432,8 @@ def main():
     protected, reason = is_protected(filepath)
 
     if protected:
-        print(f"BLOCKED: {reason}", file=sys.stderr)
-        print(f"File: {filepath}", file=sys.stderr)
+        # One write for both lines: this is the path users actually see
+        sys.stderr.write(f"BLOCKED: {reason}\nFile: {filepath}\n")
         sys.exit(1)
 
     # File is not protected, allow the operation to proceed
@@ -0,0 +1,187 @@
+#!/bin/sh
+# ABOUTME: POSIX sh port of protect-sensitive-files.py for low-latency PreToolUse checks
+# ABOUTME: Exits with non-zero status to block the operation
+
+# =============================================================================
+# Protect Sensitive Files Hook (POSIX sh + jq)
+# =============================================================================
+#
+# PURPOSE:
+# Same policy and fail-closed behavior as protect-sensitive-files.py, without
+# starting a Python interpreter. The hook fires on every Read/Write/Edit tool
+# call, and interpreter startup (tens of ms) dwarfs the microseconds of actual
+# matching. /bin/sh plus one jq process to parse the payload is several times
+# cheaper per call.
+#
+# REQUIREMENTS:
+# - jq (used to parse the stdin JSON payload; the hook blocks if it is missing)
+#
+# CONFIGURATION:
+# Add this hook to your settings.json:
+#
+# {
+#   "hooks": {
+#     "PreToolUse": [
+#       {
+#         "matcher": "Read(*)|Write(*)|Edit(*)",
+#         "hooks": [{
+#           "type": "command",
+#           "command": "sh ~/.claude/hooks/protect-sensitive-files.sh"
+#         }]
+#       }
+#     ]
+#   }
+# }
+#
+# POLICY:
+# PROTECTED_PATTERNS and PROTECTED_DIRECTORIES below mirror the lists in
+# protect-sensitive-files.py. Check order matches the Python hook:
+#   1. Any path component is a protected directory
+#   2. The filename is an exact protected name (.env, id_rsa, ...)
+#   3. The filename matches a wildcard pattern (*.pem, .env.*, ...)
+#   4. An exact name or path fragment appears anywhere in the path
+# The one difference: "*" inside a path fragment (gcloud/*.json) may span
+# several components here, so the sh port blocks a superset there.
+#
+# EXIT CODES:
+#   0 - File is not protected, operation is allowed
+#   1 - File is protected OR payload is missing/malformed (fail-closed)
+# =============================================================================
+
+# =============================================================================
+# PROTECTED FILE PATTERNS AND DIRECTORIES
+# =============================================================================
+# Whitespace-separated; no pattern may contain spaces. The Python hook is the
+# source of truth: these must list the same entries in the same order, and
+# tests/test_protect_sensitive_files.py fails if they drift apart.
+# =============================================================================
+PROTECTED_PATTERNS="
+.env .env.* .env.local .env.production .env.development
+credentials.json credentials.yaml credentials.yml
+secrets.json secrets.yaml secrets.yml .secrets
+*.pem *.key *.p12 *.pfx id_rsa id_ed25519 id_ecdsa
+.npmrc .pypirc .netrc .docker/config.json
+.aws/credentials .aws/config gcloud/*.json .azure/credentials
+"
+
+PROTECTED_DIRECTORIES=".git secrets credentials .aws .ssh .gnupg"
+
+# The pattern lists must never be expanded against the filesystem
+set -f
+
+block() {
+    printf 'BLOCKED: %s\n' "$1" >&2
+    exit 1
+}
+
+# =============================================================================
+# READ AND PARSE STDIN PAYLOAD
+# =============================================================================
+# Claude Code passes the full tool invocation as JSON on stdin. Any failure
+# here blocks the operation - we never default-allow.
+# =============================================================================
+payload=$(cat) || block "Could not read stdin"
+
+case $payload in
+    *[![:space:]]*) ;;
+    *) block "Empty stdin; expected tool invocation JSON" ;;
+esac
+
+command -v jq >/dev/null 2>&1 || block "jq not found; cannot parse tool invocation JSON"
+
+# jq emits shell assignments quoted with @sh, so paths containing quotes or
+# newlines survive the round trip. Backslashes are normalized to "/" here so
+# Windows paths split into components like everywhere else.
+#
+# jq would otherwise process each of several concatenated JSON documents,
+# and eval would keep only the last one's assignments, so a harmless second
+# document could mask a protected first. The input is slurped (-s) and must
+# hold exactly one document, as json.load() in the Python hook requires.
+assignments=$(printf '%s' "$payload" | jq -r -s '
+    if length != 1 then
+        "status=malformed"
+    else
+        .[0] |
+        if type != "object" or (.tool_input | type) != "object" then
+            "status=missing_tool_input"
+        elif (.tool_input.file_path | type) != "string" or .tool_input.file_path == "" then
+            "status=missing_file_path"
+        else
+            "status=ok filepath=\(.tool_input.file_path | @sh) normalized=\(.tool_input.file_path | gsub("\\\\"; "/") | @sh)"
+        end
+    end
+' 2>/dev/null) || block "Malformed JSON on stdin"
+
+status=
+filepath=
+normalized=
+eval "$assignments"
+
+case $status in
+    ok) ;;
+    missing_tool_input) block "Missing tool_input in stdin payload" ;;
+    missing_file_path) block "Missing or empty tool_input.file_path" ;;
+    *) block "Malformed JSON on stdin" ;;
+esac
+
+protected() {
+    printf 'BLOCKED: %s\nFile: %s\n' "$1" "$filepath" >&2
+    exit 1
+}
+
+# Strip trailing slashes, as the Python hook does, so "/app/x.pem/" still
+# ends in the component "x.pem"
+normalized=${normalized%"${normalized##*[!/]}"}
+
+# =============================================================================
+# CHECK PROTECTED DIRECTORIES
+# =============================================================================
+# Compare whole path components so ".github" never matches ".git".
+# =============================================================================
+saved_ifs=$IFS
+IFS=/
+# shellcheck disable=SC2086
+set -- $normalized
+IFS=$saved_ifs
+for part in "$@"; do
+    for dir in $PROTECTED_DIRECTORIES; do
+        [ "$part" = "$dir" ] && protected "Directory '$dir' is protected"
+    done
+done
+
+# =============================================================================
+# CHECK PROTECTED FILE PATTERNS
+# =============================================================================
+name=${normalized##*/}
+
+# Exact filenames
+for pattern in $PROTECTED_PATTERNS; do
+    case $pattern in
+        *[*/]*) ;;
+        *) [ "$name" = "$pattern" ] && protected "File matches protected pattern '$pattern'" ;;
+    esac
+done
+
+# Wildcard filename patterns (the unquoted $pattern is matched as a glob)
+for pattern in $PROTECTED_PATTERNS; do
+    case $pattern in
+        */*) ;;
+        *\**)
+            # shellcheck disable=SC2254
+            case $name in $pattern) protected "File matches protected pattern '$pattern'" ;; esac
+            ;;
+    esac
+done
+
+# Exact names and path fragments anywhere in the path
+for pattern in $PROTECTED_PATTERNS; do
+    case $pattern in
+        */*) ;;
+        *\**) continue ;;  # wildcard filename pattern, checked above
+    esac
+    # shellcheck disable=SC2254
+    case $normalized in *$pattern*) protected "File matches protected pattern '$pattern'" ;; esac
+done
+
+# File is not protected, allow the operation to proceed
+exit 0
@@ -15,6 +15,22 @@ class Colors:
     END = '\033[0m'
 
 
+# (stream, is_tty) for the last sys.stdout seen by color(). isatty() is a
+# system call and color() runs several times per reported file, so the
+# answer is cached per stream object; replacing sys.stdout (redirection in
+# tests, for example) still gets a fresh check.
+_tty_cache = (None, False)
+
+
+def _stdout_is_tty() -> bool:
+    """Return whether sys.stdout is a terminal, checking each stream once."""
+    global _tty_cache
+    stream = sys.stdout
+    if _tty_cache[0] is not stream:
+        _tty_cache = (stream, stream.isatty())
+    return _tty_cache[1]
+
+
 def color(text: str, c: str) -> str:
     """Apply ANSI color codes to text if running in a terminal.
 
@@ -28,6 +44,6 @@ def color(text: str, c: str) -> str:
     Returns:
         Colorized text (if TTY) or plain text (if not TTY)
     """
-    if sys.stdout.isatty():
+    if _stdout_is_tty():
         return f"{c}{text}{Colors.END}"
     return text
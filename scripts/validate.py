@@ -38,19 +38,48 @@ Exit codes:
 # =============================================================================
 # Standard library imports only - no external dependencies required.
 # This ensures the script can run on any system with Python 3.6+.
+# (orjson is used when it happens to be installed; see below.)
 # =============================================================================
 
+import argparse      # For command-line options
+import codecs        # For byte-order marks when parsing JSON from bytes
+import fnmatch       # For matching file names against glob patterns
+import hashlib       # For content hashes in the --skip-unchanged cache
 import json          # For parsing and validating JSON files
-import os            # For environment variable access (not heavily used)
+import os            # For CPU count when sizing the worker pool
 import re            # Regular expressions for pattern matching
 import sys           # For command-line arguments and exit codes
+import tempfile      # For per-run temporary cache files
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # Parallel reads and validation
 from pathlib import Path  # Modern path handling (better than os.path)
-from typing import List, Tuple, Optional  # Type hints for documentation
+from typing import AbstractSet, Dict, Iterator, List, Tuple, Optional, Union  # Type hints for documentation
 
 # Add scripts/ to path for shared lib imports
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from lib.terminal import Colors, color
 
+# =============================================================================
+# ORJSON IMPORT (OPTIONAL DEPENDENCY)
+# =============================================================================
+# orjson parses JSON about twice as fast as the json module. It's only a
+# fast path: validate_json() still asks json.loads() about anything orjson
+# rejects, and about anything nested deeply enough that the two could
+# disagree, so results and error messages are the same with or without it.
+# =============================================================================
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson not installed - json.loads() does all the parsing
+    ORJSON_AVAILABLE = False
+
+# json.loads() raises RecursionError on deeply nested input, while orjson
+# accepts it. Nesting depth can't exceed the number of [ and { bytes, so
+# an orjson pass is only trusted for files with at most this many; the
+# limit sits well inside the default recursion limit of 1000.
+ORJSON_MAX_BRACKETS = 500
+
 
 # =============================================================================
 # OUTPUT HELPER FUNCTIONS
@@ -58,25 +87,30 @@ from lib.terminal import Colors, color
 # These functions provide a consistent way to print different types of
 # messages. Using dedicated functions ensures consistent formatting and
 # makes it easy to change the format in one place.
+#
+# Each format_* function builds a message line without printing it, so a
+# directory run can collect every line and emit the report with a single
+# write. The matching print helpers wrap them for one-off messages.
 # =============================================================================
 
-def success(msg: str) -> None:
+def format_success(msg: str) -> str:
     """
-    Print a success message with a green checkmark prefix.
+    Format a success message with a green checkmark prefix.
 
     Used to indicate that a file passed validation.
 
     Args:
         msg: The message to display (typically a file path)
 
-    Output format: ✓ filename.json
+    Returns:
+        The formatted line (no trailing newline): ✓ filename.json
     """
-    print(f"{color('✓', Colors.GREEN)} {msg}")
+    return f"{color('✓', Colors.GREEN)} {msg}"
 
 
-def warning(msg: str) -> None:
+def format_warning(msg: str) -> str:
     """
-    Print a warning message with a yellow exclamation prefix.
+    Format a warning message with a yellow exclamation prefix.
 
     Used for non-critical issues that don't fail validation but
     should be reviewed, like broken internal links.
@@ -84,37 +118,60 @@ def warning(msg: str) -> None:
     Args:
         msg: The warning message to display
 
-    Output format: ! Warning description
+    Returns:
+        The formatted line (no trailing newline): ! Warning description
     """
-    print(f"{color('!', Colors.YELLOW)} {msg}")
+    return f"{color('!', Colors.YELLOW)} {msg}"
 
 
-def error(msg: str) -> None:
+def format_error(msg: str) -> str:
     """
-    Print an error message with a red X prefix.
+    Format an error message with a red X prefix.
 
     Used to indicate validation failures that need to be fixed.
 
     Args:
         msg: The error message to display
 
-    Output format: ✗ Error description
+    Returns:
+        The formatted line (no trailing newline): ✗ Error description
     """
-    print(f"{color('✗', Colors.RED)} {msg}")
+    return f"{color('✗', Colors.RED)} {msg}"
 
 
-def info(msg: str) -> None:
+def format_info(msg: str) -> str:
     """
-    Print an informational message with a blue arrow prefix.
+    Format an informational message with a blue arrow prefix.
 
     Used for status updates and general information.
 
     Args:
         msg: The info message to display
 
-    Output format: → Information
+    Returns:
+        The formatted line (no trailing newline): → Information
     """
-    print(f"{color('→', Colors.BLUE)} {msg}")
+    return f"{color('→', Colors.BLUE)} {msg}"
+
+
+def success(msg: str) -> None:
+    """Print a success message (see format_success)."""
+    print(format_success(msg))
+
+
+def warning(msg: str) -> None:
+    """Print a warning message (see format_warning)."""
+    print(format_warning(msg))
+
+
+def error(msg: str) -> None:
+    """Print an error message (see format_error)."""
+    print(format_error(msg))
+
+
+def info(msg: str) -> None:
+    """Print an informational message (see format_info)."""
+    print(format_info(msg))
 
 
 # =============================================================================
@@ -125,7 +182,7 @@ def info(msg: str) -> None:
 # (just a string key starting with "//").
 # =============================================================================
 
-def validate_json(file_path: Path) -> Tuple[bool, Optional[str]]:
+def validate_json(file_path: Path, content: Union[str, bytes]) -> Tuple[bool, Optional[str]]:
     """
     Validate that a file contains valid JSON syntax.
 
@@ -136,6 +193,8 @@ def validate_json(file_path: Path) -> Tuple[bool, Optional[str]]:
 
     Args:
         file_path: Path to the JSON file to validate
+        content: The file's text or raw UTF-8 bytes, already read by the
+                 caller. Bytes let json.loads() decode in C.
 
     Returns:
         A tuple of (is_valid, error_message):
@@ -147,11 +206,19 @@ def validate_json(file_path: Path) -> Tuple[bool, Optional[str]]:
       - Missing quotes: {key: "value"} - keys must be quoted
       - Single quotes: {'key': 'value'} - must use double quotes
     """
-    try:
-        # Read the file with UTF-8 encoding to handle any special characters
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Short of deep nesting, orjson accepts only what json.loads() accepts
+    # (it is stricter about NaN, huge integers and encodings), so a pass on
+    # a shallow file is final. Otherwise json.loads() below decides and
+    # supplies the usual message.
+    if (ORJSON_AVAILABLE and isinstance(content, bytes)
+            and content.count(b'[') + content.count(b'{') <= ORJSON_MAX_BRACKETS):
+        try:
+            orjson.loads(content)
+            return True, None
+        except orjson.JSONDecodeError:
+            pass
 
+    try:
         # Our JSON files use "// KEY": "description" for comments.
         # This is valid JSON (just a key starting with "//"), so
         # json.loads() handles them without any preprocessing.
@@ -163,7 +230,8 @@ def validate_json(file_path: Path) -> Tuple[bool, Optional[str]]:
         # JSONDecodeError includes helpful info: line number, column, message
         return False, f"JSON syntax error: {e}"
     except Exception as e:
-        # Catch other errors like file not found or permission denied
+        # Raw bytes that aren't valid UTF-8, or nesting too deep for the
+        # parser (RecursionError)
         return False, f"Error reading file: {e}"
 
 
@@ -174,7 +242,11 @@ def validate_json(file_path: Path) -> Tuple[bool, Optional[str]]:
 # This parser handles simple YAML without requiring external libraries.
 # =============================================================================
 
-def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
+# Compiled once at import; these patterns run on every validated file.
+# A line containing only --- (the closing frontmatter delimiter)
+FRONTMATTER_END_RE = re.compile(r'\n---\s*\n')
+
+def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict, int]:
     """
     Extract and parse YAML frontmatter from a Markdown file.
 
@@ -199,33 +271,40 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
         content: The full content of the markdown file
 
     Returns:
-        A tuple of (is_valid, error_message, parsed_data):
-          - (True, None, {...}) if frontmatter is valid
-          - (False, "error", {}) if validation failed
+        A tuple of (is_valid, error_message, parsed_data, body_start):
+          - (True, None, {...}, offset) if frontmatter is valid, where
+            content[offset:] is the body after the closing ---
+          - (False, "error", {}, 0) if validation failed
 
     Why not use PyYAML?
         We want this script to work without any pip dependencies.
-        Our YAML usage is simple enough for a minimal parser.
+        Our YAML usage is simple enough for a minimal parser. It is also
+        faster here: frontmatter blocks are a few lines long, so PyYAML's
+        per-document setup dominates, and even yaml.CSafeLoader measured
+        about 10x slower than this loop across the repo's skills and agents.
     """
     # -------------------------------------------------------------------------
     # Check for opening delimiter
     # -------------------------------------------------------------------------
     # Frontmatter must start at the very beginning of the file with ---
     if not content.startswith('---'):
-        return False, "Missing YAML frontmatter (file should start with ---)", {}
+        return False, "Missing YAML frontmatter (file should start with ---)", {}, 0
 
     # -------------------------------------------------------------------------
     # Find closing delimiter
     # -------------------------------------------------------------------------
     # Look for the closing --- after the opening one
-    # We search starting from position 3 (after the opening ---)
+    # We search starting from position 3 (after the opening ---), passing
+    # it as pos rather than slicing, so the file isn't copied
     # The pattern \n---\s*\n matches a line containing only ---
-    end_match = re.search(r'\n---\s*\n', content[3:])
+    end_match = FRONTMATTER_END_RE.search(content, 3)
     if not end_match:
-        return False, "Missing closing --- for frontmatter", {}
+        return False, "Missing closing --- for frontmatter", {}, 0
 
-    # Extract the frontmatter text (between the --- markers)
-    frontmatter_text = content[3:end_match.start() + 3]
+    # Extract the frontmatter text (between the --- markers); the body
+    # starts right after the closing delimiter line
+    frontmatter_text = content[3:end_match.start()]
+    body_start = end_match.end()
 
     # -------------------------------------------------------------------------
     # Parse the YAML content
@@ -236,9 +315,14 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
         current_value = []           # Lines of current multi-line value
         in_multiline = False         # Are we in a multi-line value?
 
+        # split('\n') rather than splitlines(): the latter also breaks on
+        # characters like U+2028 that can appear inside a description
         for line in frontmatter_text.split('\n'):
+            # Strip once; the result serves the blank check and continuations
+            stripped = line.strip()
+
             # Skip empty lines (but include them in multi-line values)
-            if not line.strip():
+            if not stripped:
                 if in_multiline:
                     current_value.append('')
                 continue
@@ -247,7 +331,8 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
             # Check if this line starts a new key: value pair
             # ----------------------------------------------------------------
             # A line that doesn't start with a space and contains ':' is a key
-            if not line.startswith(' ') and ':' in line:
+            # (line is non-empty here, so line[0] is safe)
+            if line[0] != ' ' and ':' in line:
                 # Save the previous multi-line value if there was one
                 if current_key and in_multiline:
                     data[current_key] = '\n'.join(current_value).strip()
@@ -280,16 +365,16 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
             elif in_multiline and current_key:
                 # This line is part of the multi-line value
                 # Strip leading whitespace (YAML multi-line values are indented)
-                current_value.append(line.strip())
+                current_value.append(stripped)
 
         # Save the last multi-line value if the file ended during one
         if current_key and in_multiline:
             data[current_key] = '\n'.join(current_value).strip()
 
-        return True, None, data
+        return True, None, data, body_start
 
     except Exception as e:
-        return False, f"YAML parsing error: {e}", {}
+        return False, f"YAML parsing error: {e}", {}, 0
 
 
 # =============================================================================
@@ -298,7 +383,13 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Optional[str], dict]:
 # Validates SKILL.md files according to the Claude Code skills specification.
 # =============================================================================
 
-def validate_skill_md(file_path: Path) -> List[str]:
+# Skill names: lowercase letter, then lowercase letters, digits, hyphens.
+# Used with fullmatch(), which anchors both ends without $'s allowance for
+# a trailing newline.
+SKILL_NAME_RE = re.compile(r'[a-z][a-z0-9-]*')
+
+
+def validate_skill_md(file_path: Path, content: str) -> List[str]:
     """
     Validate a SKILL.md file for required format and fields.
 
@@ -310,6 +401,7 @@ def validate_skill_md(file_path: Path) -> List[str]:
 
     Args:
         file_path: Path to the SKILL.md file to validate
+        content: The file's text, already read by the caller
 
     Returns:
         A list of error messages (empty list if valid)
@@ -321,19 +413,10 @@ def validate_skill_md(file_path: Path) -> List[str]:
     """
     errors = []
 
-    # -------------------------------------------------------------------------
-    # Read the file
-    # -------------------------------------------------------------------------
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return [f"Cannot read file: {e}"]
-
     # -------------------------------------------------------------------------
     # Validate frontmatter exists and is parseable
     # -------------------------------------------------------------------------
-    valid, err, data = validate_yaml_frontmatter(content)
+    valid, err, data, body_start = validate_yaml_frontmatter(content)
     if not valid:
         errors.append(err)
         return errors  # Can't continue validation without frontmatter
@@ -351,11 +434,10 @@ def validate_skill_md(file_path: Path) -> List[str]:
             errors.append(f"name exceeds 64 characters: {len(name)}")
 
         # Check format: lowercase letters and hyphens only
-        # ^        = start of string
         # [a-z]    = must start with lowercase letter
         # [a-z0-9-]* = followed by any combo of lowercase, numbers, hyphens
-        # $        = end of string
-        if not re.match(r'^[a-z][a-z0-9-]*$', name):
+        # fullmatch() = the whole name, start to end, must match
+        if not SKILL_NAME_RE.fullmatch(name):
             errors.append(f"name must be lowercase with hyphens: {name}")
 
     # -------------------------------------------------------------------------
@@ -373,16 +455,13 @@ def validate_skill_md(file_path: Path) -> List[str]:
     # -------------------------------------------------------------------------
     # Validate body content
     # -------------------------------------------------------------------------
-    # Find where the frontmatter ends (after the closing ---)
-    frontmatter_end = content.find('\n---\n', 3)
-    if frontmatter_end > 0:
-        # Extract the body (everything after the frontmatter)
-        body = content[frontmatter_end + 5:].strip()
+    # Extract the body (everything after the closing --- found above)
+    body = content[body_start:].strip()
 
-        # Check that there's meaningful content
-        # 100 chars is a low bar - a good skill should have much more
-        if len(body) < 100:
-            errors.append("SKILL.md body seems too short (< 100 chars)")
+    # Check that there's meaningful content
+    # 100 chars is a low bar - a good skill should have much more
+    if len(body) < 100:
+        errors.append("SKILL.md body seems too short (< 100 chars)")
 
     return errors
 
@@ -395,7 +474,10 @@ def validate_skill_md(file_path: Path) -> List[str]:
 # have meaningful content.
 # =============================================================================
 
-def validate_rule_md(file_path: Path) -> List[str]:
+# A top-level heading (# Title) on any line; shared with command validation
+HEADING_RE = re.compile(r'^#\s+\S', re.MULTILINE)
+
+def validate_rule_md(file_path: Path, content: str) -> List[str]:
     """
     Validate a rule markdown file in the rules/ directory.
 
@@ -407,24 +489,19 @@ def validate_rule_md(file_path: Path) -> List[str]:
 
     Args:
         file_path: Path to the rule markdown file
+        content: The file's text, already read by the caller
 
     Returns:
         A list of error messages (empty list if valid)
     """
     errors = []
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return [f"Cannot read file: {e}"]
-
     # Skip README files - they're documentation, not rules
     if file_path.name == 'README.md':
         return errors
 
     # Check for a top-level heading
-    if not re.search(r'^#\s+\S', content, re.MULTILINE):
+    if not HEADING_RE.search(content):
         errors.append("Rule file should have a top-level heading (# Title)")
 
     # Check minimum content length
@@ -441,7 +518,7 @@ def validate_rule_md(file_path: Path) -> List[str]:
 # personas for Claude Code. They require specific frontmatter fields.
 # =============================================================================
 
-def validate_agent_md(file_path: Path) -> List[str]:
+def validate_agent_md(file_path: Path, content: str) -> List[str]:
     """
     Validate an agent markdown file in the agents/ directory.
 
@@ -453,18 +530,13 @@ def validate_agent_md(file_path: Path) -> List[str]:
 
     Args:
         file_path: Path to the agent markdown file
+        content: The file's text, already read by the caller
 
     Returns:
         A list of error messages (empty list if valid)
     """
     errors = []
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return [f"Cannot read file: {e}"]
-
     # Skip README files
     if file_path.name == 'README.md':
         return errors
@@ -474,7 +546,7 @@ def validate_agent_md(file_path: Path) -> List[str]:
         errors.append("Agent file should have YAML frontmatter (---)")
         return errors
 
-    valid, err, data = validate_yaml_frontmatter(content)
+    valid, err, data, body_start = validate_yaml_frontmatter(content)
     if not valid:
         errors.append(err)
         return errors
@@ -486,12 +558,10 @@ def validate_agent_md(file_path: Path) -> List[str]:
     if 'description' not in data:
         errors.append("Missing required field: description")
 
-    # Check body content
-    frontmatter_end = content.find('\n---\n', 3)
-    if frontmatter_end > 0:
-        body = content[frontmatter_end + 5:].strip()
-        if len(body) < 100:
-            errors.append("Agent body seems too short (< 100 chars)")
+    # Check body content (everything after the closing ---)
+    body = content[body_start:].strip()
+    if len(body) < 100:
+        errors.append("Agent body seems too short (< 100 chars)")
 
     return errors
 
@@ -503,7 +573,7 @@ def validate_agent_md(file_path: Path) -> List[str]:
 # They should have a heading and meaningful instructions.
 # =============================================================================
 
-def validate_command_md(file_path: Path) -> List[str]:
+def validate_command_md(file_path: Path, content: str) -> List[str]:
     """
     Validate a command markdown file in the commands/ directory.
 
@@ -513,20 +583,15 @@ def validate_command_md(file_path: Path) -> List[str]:
 
     Args:
         file_path: Path to the command markdown file
+        content: The file's text, already read by the caller
 
     Returns:
         A list of error messages (empty list if valid)
     """
     errors = []
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        return [f"Cannot read file: {e}"]
-
     # Check for a top-level heading
-    if not re.search(r'^#\s+\S', content, re.MULTILINE):
+    if not HEADING_RE.search(content):
         errors.append("Command file should have a top-level heading")
 
     # Check minimum content length
@@ -542,7 +607,14 @@ def validate_command_md(file_path: Path) -> List[str]:
 # Checks that internal links in markdown files point to files that exist.
 # =============================================================================
 
-def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
+# Fenced code blocks (```...```), stripped before scanning for links
+CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+
+# Markdown links [text](url), capturing the text and the URL
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+def validate_markdown_links(file_path: Path, content: str, repo_root: Path,
+                            existing_paths: Optional[AbstractSet[str]] = None) -> List[str]:
     """
     Validate internal links in a markdown file.
 
@@ -551,7 +623,11 @@ def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
 
     Args:
         file_path: Path to the markdown file to check
+        content: The file's text, already read by the caller
         repo_root: Root directory of the repository (for resolving absolute paths)
+        existing_paths: Optional set from classify_repo(). A target
+                        found in it exists without a stat() call; anything
+                        else is still checked on disk.
 
     Returns:
         A list of error messages for broken links
@@ -570,25 +646,25 @@ def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
     """
     errors = []
 
-    # Read the file
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception:
-        return errors  # Can't check links if we can't read the file
-
     # -------------------------------------------------------------------------
     # Skip template files (their links are relative to where they'll be placed)
     # -------------------------------------------------------------------------
     if 'TEMPLATE' in file_path.name or 'SPEC' in file_path.name:
         return errors
 
+    # Every link starts with '[', and this substring test is far cheaper
+    # than the regex passes below, so link-free files stop here
+    if '[' not in content:
+        return errors
+
     # -------------------------------------------------------------------------
     # Strip fenced code blocks before checking links
     # -------------------------------------------------------------------------
     # Links inside code blocks (```...```) are examples, not real references.
-    # Remove them to avoid false positive warnings.
-    content_no_codeblocks = re.sub(r'```[\s\S]*?```', '', content)
+    # Remove them to avoid false positive warnings. (Filtering link matches
+    # against bisected fence ranges instead avoids this copy but measured
+    # slower: the sub runs in C, the per-link range checks do not.)
+    content_no_codeblocks = CODE_BLOCK_RE.sub('', content)
 
     # -------------------------------------------------------------------------
     # Find all markdown links
@@ -596,7 +672,14 @@ def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
     # Pattern: [text](url)
     #   \[([^\]]+)\]  = [text] - capture the link text
     #   \(([^)]+)\)   = (url)  - capture the URL/path
-    links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content_no_codeblocks)
+    # findall rather than finditer: a document has tens of links at most,
+    # and building a match object per link measured slower than the list
+    links = MARKDOWN_LINK_RE.findall(content_no_codeblocks)
+
+    # Targets are joined as strings; a Path is only built for the rare
+    # target that has to be checked on disk
+    base_dir = os.path.dirname(file_path)
+    root_dir = os.fspath(repo_root)
 
     for text, link in links:
         # ---------------------------------------------------------------------
@@ -634,18 +717,26 @@ def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
         # ---------------------------------------------------------------------
         if path_part.startswith('./'):
             # Relative to current file's directory: ./subdir/file.md
-            target = file_path.parent / path_part[2:]
+            target = os.path.join(base_dir, path_part[2:])
         elif path_part.startswith('/'):
             # Absolute from repo root: /docs/file.md
-            target = repo_root / path_part[1:]
+            target = os.path.join(root_dir, path_part[1:])
         else:
             # Relative without ./ prefix: subdir/file.md
-            target = file_path.parent / path_part
+            target = os.path.join(base_dir, path_part)
 
         # ---------------------------------------------------------------------
         # Check if the target exists
         # ---------------------------------------------------------------------
-        if not target.exists():
+        # Most targets are in the pre-scanned set. Misses (broken links, or
+        # targets outside the scanned tree) fall back to a real check, as
+        # does any target containing '..': normpath collapses it lexically,
+        # but the kernel resolves it, so missing/../README.md is broken
+        # even though README.md exists.
+        if (existing_paths is not None and '..' not in target
+                and os.path.normpath(target) in existing_paths):
+            continue
+        if not Path(target).exists():
             errors.append(f"Broken link: [{text}]({link})")
 
     return errors
@@ -655,23 +746,548 @@ def validate_markdown_links(file_path: Path, repo_root: Path) -> List[str]:
 # FILE DISCOVERY
 # =============================================================================
 
-def find_files(root: Path, pattern: str) -> List[Path]:
+def walk_tree(root: Path,
+              skip_dirs: AbstractSet[str] = frozenset()
+              ) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """
+    Walk a directory tree with os.scandir, yielding each directory's entries.
+
+    The order matches Path.rglob: depth-first, with each directory yielded
+    before its subdirectories, which are visited in scandir order.
+    Symlinked directories are listed but not descended into, and DirEntry
+    already knows each entry's type, so the walk never calls stat().
+
+    Directories are kept as the path strings scandir hands back; callers
+    build a Path only for the entries they keep, rather than one for every
+    directory visited.
+
+    Args:
+        root: Directory to walk
+        skip_dirs: Directory names not to descend into (e.g. {".git"})
+
+    Yields:
+        (directory, entries) pairs, one per directory visited, with
+        directory as a path string starting with str(root)
     """
-    Find all files matching a glob pattern recursively.
+    stack = [os.fspath(root)]
 
-    This is a thin wrapper around Path.rglob() for consistent interface.
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable or vanished directory; rglob skips it too
+
+        yield directory, entries
+
+        subdirs = [entry.path for entry in entries
+                   if entry.is_dir(follow_symlinks=False)
+                   and entry.name not in skip_dirs]
+        # Reversed so the first subdirectory is walked next (depth-first)
+        stack.extend(reversed(subdirs))
+
+
+def find_files(root: Path, patterns: List[str]) -> Dict[str, List[Path]]:
+    """
+    Find all files matching any of several glob patterns, in one walk.
+
+    Tests each entry name against every pattern, so asking for "*.json"
+    and "SKILL.md" together costs a single traversal. Results match
+    Path.rglob(pattern) for each pattern.
 
     Args:
         root: Directory to search in
-        pattern: Glob pattern (e.g., "*.json", "SKILL.md")
+        patterns: Glob patterns matched against entry names
+                  (e.g., "*.json", "SKILL.md")
 
     Returns:
-        List of Path objects for matching files
+        A dict mapping each pattern to its list of matching Paths
 
     Example:
-        json_files = find_files(Path("./"), "*.json")
+        found = find_files(Path("./"), ["*.json", "SKILL.md"])
+        json_files = found["*.json"]
+    """
+    found = {pattern: [] for pattern in patterns}
+
+    for _, entries in walk_tree(root):
+        for entry in entries:
+            for pattern in patterns:
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    found[pattern].append(Path(entry.path))
+
+    return found
+
+
+# Top-level directories whose markdown files get their own checks
+CHECKED_SUBDIRS = ('rules', 'agents', 'commands')
+
+# Directories never validated; the walk skips them instead of listing
+# their (often thousands of) files only for the checks to discard them
+PRUNED_DIRS = frozenset({'.git', 'node_modules', '.venv', '__pycache__'})
+
+
+def classify_repo(root: Path) -> Tuple[Dict[str, List[Path]], frozenset]:
     """
-    return list(root.rglob(pattern))
+    Find every file validate_directory checks, in a single walk.
+
+    Each entry is sorted into groups by name and by the top-level
+    directory it sits under. The same walk also records every path it
+    sees, so link validation can look targets up instead of stat()ing
+    them.
+
+    Directories named in PRUNED_DIRS (.git/, node_modules/, ...) are not
+    descended into, so nothing under them is validated or listed. Lists
+    are in Path.rglob order, so they match the per-pattern rglob calls
+    this replaces.
+
+    Args:
+        root: Directory to classify
+
+    Returns:
+        A tuple of (groups, existing_paths):
+          - groups maps 'json', 'skills', 'rules', 'agents', 'commands',
+            and 'md' to lists of Paths. 'md' holds every *.md entry,
+            including those also listed under another group.
+          - existing_paths is a frozenset of every entry seen (plus root),
+            as os.path.normpath strings. Symlinks are left out, since one
+            may dangle; links to them fall back to a real existence check.
+    """
+    groups = {'json': [], 'skills': [], 'md': []}
+    groups.update((name, []) for name in CHECKED_SUBDIRS)
+    paths = {os.path.normpath(root)}
+    root_str = os.fspath(root)
+    # Walked directories are root_str plus this separator plus a subpath
+    prefix_len = len(os.path.join(root_str, ''))
+
+    for directory, entries in walk_tree(root, skip_dirs=PRUNED_DIRS):
+        # Which top-level directory of root we're in (None at root itself)
+        if directory == root_str:
+            top = None
+        else:
+            top = directory[prefix_len:].split(os.sep, 1)[0]
+        subdir_group = groups[top] if top in CHECKED_SUBDIRS else None
+
+        for entry in entries:
+            name = entry.name
+            # is_symlink() is answered from the scandir data, no stat()
+            if not entry.is_symlink():
+                paths.add(os.path.normpath(entry.path))
+
+            # Names are dispatched as strings; only kept files become Paths
+            if name.endswith('.json'):
+                groups['json'].append(Path(entry.path))
+            elif name.endswith('.md'):
+                md_file = Path(entry.path)
+                groups['md'].append(md_file)
+                if name == 'SKILL.md':
+                    groups['skills'].append(md_file)
+                if subdir_group is not None:
+                    subdir_group.append(md_file)
+
+    # The walk doesn't follow symlinks, but a symlinked rules/ (say) was
+    # still searched when it was its own rglob root, so search it directly
+    for name in CHECKED_SUBDIRS:
+        subdir = root / name
+        if subdir.is_symlink() and subdir.is_dir():
+            groups[name] = find_files(subdir, ['*.md'])['*.md']
+
+    return groups, frozenset(paths)
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+# With --skip-unchanged, a directory run records a content hash and result
+# for every file it validated in .validate-cache.json at the top of that
+# directory. On the next run, a file whose hash is unchanged and which
+# passed last time is reported from the cache instead of being re-parsed.
+#
+# Link checks are never cached: whether a link is broken depends on other
+# files existing, not on the content of the file holding the link. The
+# cache also records a hash of this script, so editing any validation rule
+# discards every cached result.
+# =============================================================================
+
+# Cache file written at the top of the validated directory
+CACHE_FILENAME = '.validate-cache.json'
+
+# Task kinds whose result depends only on the file's own content
+CACHEABLE_KINDS = frozenset({'json', 'skill', 'rule', 'agent', 'command'})
+
+
+def content_digest(data: bytes) -> str:
+    """
+    Hash file bytes for change detection.
+
+    Args:
+        data: Raw file content
+
+    Returns:
+        A hex digest of the content
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_digest(file_path) -> Optional[str]:
+    """
+    Hash a file's bytes for change detection.
+
+    Args:
+        file_path: Path (or path string) of the file to hash
+
+    Returns:
+        A hex digest of the content, or None if the file can't be read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return content_digest(f.read())
+    except OSError:
+        return None
+
+
+def load_cache(path: Path) -> dict:
+    """
+    Load cached results for a directory.
+
+    Args:
+        path: Directory whose cache file should be read
+
+    Returns:
+        A dict mapping "kind:relative/path" to {"hash", "ok"}.
+        Empty if there is no cache, it is unreadable, or it was written
+        by a different version of this script.
+    """
+    try:
+        with open(path / CACHE_FILENAME, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get('validator') != file_digest(__file__):
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(path: Path, entries: dict) -> None:
+    """
+    Write cached results for a directory.
+
+    A failed write only costs a full run next time, so errors are ignored.
+    Each run writes its own uniquely named temporary file and renames it
+    into place, so an interrupted run never leaves a torn cache, and two
+    runs at once can't interleave writes (the last rename wins whole).
+
+    Args:
+        path: Directory whose cache file should be written
+        entries: Mapping from "kind:relative/path" to {"hash", "ok"}
+    """
+    cache = {'validator': file_digest(__file__), 'files': entries}
+    cache_path = path / CACHE_FILENAME
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path, prefix=CACHE_FILENAME + '.',
+                                        suffix='.tmp')
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is None:
+            return
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def cache_key(kind: str, file_path: str, path: Path) -> str:
+    """Return the cache key for one check of one file under path."""
+    return f"{kind}:{Path(file_path).relative_to(path).as_posix()}"
+
+
+# =============================================================================
+# VALIDATION DISPATCH
+# =============================================================================
+# A directory run is a list of (kind, file) checks. Checks are grouped by
+# file into tasks, so each file is opened, read, and decoded exactly once
+# no matter how many checks apply to it (a SKILL.md gets both the skill and
+# the link check), and the cache hash is taken from that same read. Files
+# are read in full: every markdown file gets the link check, which needs
+# all of its text, so a size-capped read for the rule or command checks
+# would only add a second read.
+#
+# Tasks are plain tuples so they can be sent to worker processes, and
+# _validate_task is a top-level function so the pool can pickle it by
+# reference. A worker process costs more to start than this repository
+# takes to validate serially, so the pool is only used once a run has
+# enough files to pay for it. The checks themselves never run on threads:
+# they are pure Python regex and string work that holds the GIL. With
+# --read-ahead, a serial run hands only the reads to a small thread pool
+# (reads release the GIL), so open/read latency on a network filesystem
+# overlaps with checking earlier files. It is off by default because on a
+# local disk with warm caches the threads cost more than the reads.
+# =============================================================================
+
+# Minimum number of files before validation fans out to worker processes
+PARALLEL_MIN_TASKS = 512
+
+# Tasks handed to a worker per round trip; amortizes pickling overhead
+PARALLEL_CHUNKSIZE = 16
+
+# Threads reading files ahead of the serial checks with --read-ahead. A
+# few threads hide per-file open/read latency on slow or network filesystems.
+READ_WORKERS = 16
+
+# Paths known to exist for link checks in this process (see
+# classify_repo), or None to stat every target. Installed once per
+# worker by run_validation_tasks rather than pickled into every task.
+_existing_paths: Optional[frozenset] = None
+
+
+def _set_existing_paths(paths: Optional[frozenset]) -> None:
+    """Install the known-path set for link checks in this process."""
+    global _existing_paths
+    _existing_paths = paths
+
+
+def _read_error(kind: str, exc: Exception) -> List[str]:
+    """
+    Return the messages a check reports when its file can't be read.
+
+    Args:
+        kind: The check that needed the file
+        exc: The error raised while reading or decoding it
+
+    Returns:
+        A list of error messages. Link checks report nothing, since an
+        unreadable file has no links to check.
+    """
+    if kind == 'links':
+        return []
+    if kind == 'json':
+        return [f"Error reading file: {exc}"]
+    return [f"Cannot read file: {exc}"]
+
+
+def _json_needs_text(data: bytes) -> bool:
+    """
+    Report whether JSON bytes must be decoded as UTF-8 text before parsing.
+
+    json.loads() on bytes honors a UTF-8 BOM and auto-detects UTF-16 and
+    UTF-32, while Claude Code reads config files as plain UTF-8. Such
+    files take the text path so they fail exactly as a UTF-8 read would.
+
+    Args:
+        data: Raw file content
+
+    Returns:
+        True if data starts with a byte-order mark or has a NUL byte in
+        the first four bytes (how json.loads() spots UTF-16/32)
+    """
+    return (data.startswith((codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE))
+            or b'\x00' in data[:4])
+
+
+def _run_check(kind: str, path: Path, content: str, repo_root: Path) -> List[str]:
+    """
+    Run one check on already-read file content.
+
+    Args:
+        kind: One of 'json', 'skill', 'rule', 'agent', 'command', or 'links'
+        path: Path of the file being checked
+        content: The file's decoded text
+        repo_root: Root for resolving absolute links
+
+    Returns:
+        A list of error messages (empty list if the file is valid). For
+        'links' the messages are broken-link warnings.
+    """
+    if kind == 'json':
+        valid, err = validate_json(path, content)
+        return [] if valid else [err]
+    if kind == 'skill':
+        return validate_skill_md(path, content)
+    if kind == 'rule':
+        return validate_rule_md(path, content)
+    if kind == 'agent':
+        return validate_agent_md(path, content)
+    if kind == 'command':
+        return validate_command_md(path, content)
+    if kind == 'links':
+        return validate_markdown_links(path, content, repo_root, _existing_paths)
+    raise ValueError(f"Unknown validation kind: {kind}")
+
+
+def _read_bytes(file_path: str) -> Union[bytes, OSError]:
+    """
+    Read a file's raw bytes, returning the error instead of raising it.
+
+    Args:
+        file_path: Path of the file to read
+
+    Returns:
+        The file's content, or the OSError that prevented reading it
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        return e
+
+
+def _validate_task(task: tuple) -> Tuple[Optional[str], List[List[str]]]:
+    """
+    Read one file and run every check that applies to it.
+
+    Args:
+        task: A (file_path, kinds, repo_root, passed) tuple. kinds is a
+              tuple of check names. passed is None when caching is off;
+              otherwise it holds, for each kind, the content hash of the
+              last passing run (or None), and a kind whose hash still
+              matches is skipped.
+
+    Returns:
+        A tuple of (digest, messages): the content hash (None if caching
+        is off or the file couldn't be read) and one list of messages per
+        kind, in the same order as kinds.
+    """
+    return _check_file(task, _read_bytes(task[0]))
+
+
+def _check_file(task: tuple, data: Union[bytes, OSError]
+                ) -> Tuple[Optional[str], List[List[str]]]:
+    """
+    Run every check in a task against a file that has already been read.
+
+    Args:
+        task: The task tuple, as for _validate_task
+        data: The file's bytes from _read_bytes, or its read error
+
+    Returns:
+        The same (digest, messages) tuple as _validate_task
+    """
+    file_path, kinds, repo_root, passed = task
+    path = Path(file_path)
+
+    if isinstance(data, OSError):
+        return None, [_read_error(kind, data) for kind in kinds]
+
+    if kinds == ('json',) and not _json_needs_text(data):
+        # json.loads() decodes UTF-8 bytes in C; no str copy needed
+        content = data
+    else:
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            return None, [_read_error(kind, e) for kind in kinds]
+
+        # Match text-mode reading, which turns \r\n and lone \r into \n
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    digest = None if passed is None else content_digest(data)
+    results = []
+    for i, kind in enumerate(kinds):
+        if passed is not None and passed[i] == digest:
+            results.append([])
+        else:
+            results.append(_run_check(kind, path, content, Path(repo_root)))
+    return digest, results
+
+
+def run_validation_tasks(tasks: List[tuple],
+                         existing_paths: Optional[frozenset] = None,
+                         read_ahead: bool = False
+                         ) -> List[Tuple[Optional[str], List[List[str]]]]:
+    """
+    Run validation tasks, in parallel when the batch is large enough.
+
+    Args:
+        tasks: List of task tuples for _validate_task
+        existing_paths: Optional classify_repo() set for link checks
+        read_ahead: In a serial run, read files on a thread pool ahead of
+                    the checks
+
+    Returns:
+        One _validate_task result per task, in the same order as tasks
+    """
+    if len(tasks) < PARALLEL_MIN_TASKS:
+        _set_existing_paths(existing_paths)
+        try:
+            if not (read_ahead and tasks):
+                return [_validate_task(task) for task in tasks]
+
+            # map() reads ahead on the pool threads while this thread
+            # checks each file in order as its bytes arrive
+            with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(tasks))) as pool:
+                reads = pool.map(_read_bytes, [task[0] for task in tasks])
+                return [_check_file(task, data) for task, data in zip(tasks, reads)]
+        finally:
+            _set_existing_paths(None)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_set_existing_paths,
+                             initargs=(existing_paths,)) as pool:
+        return list(pool.map(_validate_task, tasks,
+                             chunksize=PARALLEL_CHUNKSIZE))
+
+
+def run_checks(checks: List[Tuple[str, Path]], path: Path,
+               skip_unchanged: bool = False,
+               existing_paths: Optional[frozenset] = None,
+               read_ahead: bool = False) -> List[List[str]]:
+    """
+    Run a list of checks, reading each file once.
+
+    Args:
+        checks: List of (kind, file_path) pairs, in reporting order
+        path: Directory being validated; the repo root for absolute links,
+              and home of the cache file when skip_unchanged is set
+        skip_unchanged: Skip cacheable checks that passed last run on a
+                        file whose content hasn't changed since
+        existing_paths: Optional classify_repo() set for link checks
+        read_ahead: Read files on a thread pool ahead of serial checks
+
+    Returns:
+        One list of messages per check, in the same order as checks
+    """
+    cache = load_cache(path) if skip_unchanged else None
+
+    # Group check indexes by file, keeping first-seen file order
+    by_file = {}
+    for i, (_, file_path) in enumerate(checks):
+        by_file.setdefault(str(file_path), []).append(i)
+
+    tasks = []
+    for file_path, indexes in by_file.items():
+        kinds = tuple(checks[i][0] for i in indexes)
+        passed = None
+        if cache is not None:
+            passed = []
+            for kind in kinds:
+                cached = None
+                if kind in CACHEABLE_KINDS:
+                    cached = cache.get(cache_key(kind, file_path, path))
+                passed.append(cached.get('hash') if cached and cached.get('ok') else None)
+            passed = tuple(passed)
+        tasks.append((file_path, kinds, str(path), passed))
+
+    results = [None] * len(checks)
+    entries = {}
+    outputs = run_validation_tasks(tasks, existing_paths, read_ahead)
+    for (file_path, indexes), (digest, messages) in zip(by_file.items(), outputs):
+        for i, errs in zip(indexes, messages):
+            results[i] = errs
+            kind = checks[i][0]
+            if digest and kind in CACHEABLE_KINDS:
+                # Only passes are reused, so a failure's messages aren't kept
+                entries[cache_key(kind, file_path, path)] = {
+                    'hash': digest, 'ok': not errs}
+
+    if cache is not None:
+        save_cache(path, entries)
+    return results
 
 
 # =============================================================================
@@ -680,7 +1296,8 @@ def find_files(root: Path, pattern: str) -> List[Path]:
 # Orchestrates validation of all files in a directory.
 # =============================================================================
 
-def validate_directory(path: Path) -> Tuple[int, int, int]:
+def validate_directory(path: Path, skip_unchanged: bool = False,
+                       read_ahead: bool = False) -> Tuple[int, int, int]:
     """
     Validate all configuration files in a directory.
 
@@ -691,6 +1308,9 @@ def validate_directory(path: Path) -> Tuple[int, int, int]:
 
     Args:
         path: Directory to validate
+        skip_unchanged: Reuse cached passing results for files whose
+                        content hasn't changed since the last run
+        read_ahead: Read files on a thread pool ahead of the checks
 
     Returns:
         A tuple of (files_checked, error_count, warning_count)
@@ -698,125 +1318,102 @@ def validate_directory(path: Path) -> Tuple[int, int, int]:
     Skipped paths:
       - node_modules/ - npm dependencies
       - .git/ - git internal files
+      - .venv/, __pycache__/ - Python environments and bytecode
+      - .validate-cache.json - this script's own result cache
     """
     errors = 0
     warnings = 0
     files_checked = 0
 
-    repo_root = path  # Used for resolving absolute links
+    # Every (kind, file) check to run, in reporting order
+    checks = []
+
+    # One walk finds every file to check and every path links may target
+    groups, existing_paths = classify_repo(path)
 
     # -------------------------------------------------------------------------
-    # Validate JSON files
+    # JSON files (PRUNED_DIRS were already left out by the walk)
     # -------------------------------------------------------------------------
-    json_files = find_files(path, '*.json')
-    for json_file in json_files:
-        # Skip common directories that shouldn't be validated
-        if 'node_modules' in str(json_file) or '.git' in str(json_file):
+    for json_file in groups['json']:
+        if json_file.name == CACHE_FILENAME:
             continue
+        checks.append(('json', json_file))
 
-        files_checked += 1
-        valid, err = validate_json(json_file)
-
-        # Get path relative to the root for cleaner output
-        rel_path = json_file.relative_to(path)
-
-        if valid:
-            success(f"{rel_path}")
-        else:
-            error(f"{rel_path}: {err}")
-            errors += 1
+    # -------------------------------------------------------------------------
+    # SKILL.md files
+    # -------------------------------------------------------------------------
+    for skill_file in groups['skills']:
+        checks.append(('skill', skill_file))
 
     # -------------------------------------------------------------------------
-    # Validate SKILL.md files
+    # Rule files (rules/*.md)
     # -------------------------------------------------------------------------
-    skill_files = find_files(path, 'SKILL.md')
-    for skill_file in skill_files:
-        files_checked += 1
-        errs = validate_skill_md(skill_file)
-        rel_path = skill_file.relative_to(path)
+    for rule_file in groups['rules']:
+        if rule_file.name == 'README.md':
+            continue
+        checks.append(('rule', rule_file))
 
-        if not errs:
-            success(f"{rel_path}")
-        else:
-            # A single file can have multiple errors
-            for err in errs:
-                error(f"{rel_path}: {err}")
-            errors += len(errs)
+    # -------------------------------------------------------------------------
+    # Agent files (agents/*.md)
+    # -------------------------------------------------------------------------
+    for agent_file in groups['agents']:
+        if agent_file.name == 'README.md':
+            continue
+        checks.append(('agent', agent_file))
 
     # -------------------------------------------------------------------------
-    # Validate rule files (rules/*.md)
+    # Command files (commands/**/*.md)
     # -------------------------------------------------------------------------
-    rules_dir = path / 'rules'
-    if rules_dir.is_dir():
-        rule_files = find_files(rules_dir, '*.md')
-        for rule_file in rule_files:
-            if rule_file.name == 'README.md':
-                continue
-            files_checked += 1
-            errs = validate_rule_md(rule_file)
-            rel_path = rule_file.relative_to(path)
+    for cmd_file in groups['commands']:
+        checks.append(('command', cmd_file))
 
-            if not errs:
-                success(f"{rel_path}")
-            else:
-                for err in errs:
-                    error(f"{rel_path}: {err}")
-                errors += len(errs)
+    # -------------------------------------------------------------------------
+    # Markdown links
+    # -------------------------------------------------------------------------
+    for md_file in groups['md']:
+        checks.append(('links', md_file))
 
     # -------------------------------------------------------------------------
-    # Validate agent files (agents/*.md)
+    # Run all checks, then report in task order
     # -------------------------------------------------------------------------
-    agents_dir = path / 'agents'
-    if agents_dir.is_dir():
-        agent_files = find_files(agents_dir, '*.md')
-        for agent_file in agent_files:
-            if agent_file.name == 'README.md':
-                continue
-            files_checked += 1
-            errs = validate_agent_md(agent_file)
-            rel_path = agent_file.relative_to(path)
-
-            if not errs:
-                success(f"{rel_path}")
-            else:
-                for err in errs:
-                    error(f"{rel_path}: {err}")
-                errors += len(errs)
-
-    # -------------------------------------------------------------------------
-    # Validate command files (commands/**/*.md)
-    # -------------------------------------------------------------------------
-    commands_dir = path / 'commands'
-    if commands_dir.is_dir():
-        command_files = find_files(commands_dir, '*.md')
-        for cmd_file in command_files:
-            files_checked += 1
-            errs = validate_command_md(cmd_file)
-            rel_path = cmd_file.relative_to(path)
-
-            if not errs:
-                success(f"{rel_path}")
-            else:
-                for err in errs:
-                    error(f"{rel_path}: {err}")
-                errors += len(errs)
-
-    # -------------------------------------------------------------------------
-    # Validate markdown links
-    # -------------------------------------------------------------------------
-    md_files = find_files(path, '*.md')
-    for md_file in md_files:
-        # Skip common directories
-        if 'node_modules' in str(md_file) or '.git' in str(md_file):
+    results = run_checks(checks, path, skip_unchanged, existing_paths, read_ahead)
+
+    # Collected and written once, instead of one print() per message
+    report = []
+
+    # Every checked path was built by joining names onto path, so its
+    # relative form is the string after path's prefix; slicing it off is
+    # much cheaper than Path.relative_to() for each file
+    root_str = os.fspath(path)
+    prefix = '' if root_str == os.curdir else os.path.join(root_str, '')
+    prefix_len = len(prefix)
+
+    for (kind, file_path), errs in zip(checks, results):
+        # Get path relative to the root for cleaner output
+        file_str = os.fspath(file_path)
+        if file_str.startswith(prefix):
+            rel_path = file_str[prefix_len:]
+        else:
+            rel_path = file_path.relative_to(path)
+
+        if kind == 'links':
+            # Broken links are warnings, not errors (they don't break functionality)
+            for err in errs:
+                report.append(format_warning(f"{rel_path}: {err}"))
+                warnings += 1
             continue
 
-        link_errors = validate_markdown_links(md_file, repo_root)
-        rel_path = md_file.relative_to(path)
+        files_checked += 1
+        if not errs:
+            report.append(format_success(f"{rel_path}"))
+        else:
+            # A single file can have multiple errors
+            for err in errs:
+                report.append(format_error(f"{rel_path}: {err}"))
+            errors += len(errs)
 
-        # Broken links are warnings, not errors (they don't break functionality)
-        for err in link_errors:
-            warning(f"{rel_path}: {err}")
-            warnings += 1
+    if report:
+        sys.stdout.write('\n'.join(report) + '\n')
 
     return files_checked, errors, warnings
 
@@ -852,18 +1449,19 @@ def validate_file(file_path: Path) -> Tuple[int, int]:
     # JSON validation
     # -------------------------------------------------------------------------
     if file_path.suffix == '.json':
-        valid, err = validate_json(file_path)
-        if valid:
+        errs = run_checks([('json', file_path)], file_path.parent)[0]
+        if not errs:
             success(str(file_path))
         else:
-            error(f"{file_path}: {err}")
-            errors += 1
+            for err in errs:
+                error(f"{file_path}: {err}")
+            errors += len(errs)
 
     # -------------------------------------------------------------------------
     # SKILL.md validation
     # -------------------------------------------------------------------------
     elif file_path.name == 'SKILL.md':
-        errs = validate_skill_md(file_path)
+        errs = run_checks([('skill', file_path)], file_path.parent)[0]
         if not errs:
             success(str(file_path))
         else:
@@ -886,7 +1484,7 @@ def validate_file(file_path: Path) -> Tuple[int, int]:
                 break
             current = current.parent
 
-        link_errors = validate_markdown_links(file_path, repo_root)
+        link_errors = run_checks([('links', file_path)], repo_root)[0]
         if not link_errors:
             success(str(file_path))
         else:
@@ -918,20 +1516,34 @@ def main():
         python validate.py            # Validate entire repo
         python validate.py path/      # Validate specific directory
         python validate.py file.json  # Validate specific file
+        python validate.py --skip-unchanged  # Reuse cached passing results
+        python validate.py --read-ahead      # Overlap reads (network filesystems)
 
     Exit codes:
         0 = Success (no errors, warnings are OK)
         1 = Failure (one or more errors found)
     """
+    parser = argparse.ArgumentParser(
+        description="Validate JSON, SKILL.md, rule, agent, and command files.")
+    parser.add_argument("path", nargs="?",
+                        help="File or directory to validate (default: repo root).")
+    parser.add_argument("--skip-unchanged", action="store_true",
+                        help=f"Skip files that passed last run and haven't "
+                             f"changed (cached in {CACHE_FILENAME}).")
+    parser.add_argument("--read-ahead", action="store_true",
+                        help="Read files on background threads while "
+                             "validating; helps on network filesystems.")
+    args = parser.parse_args()
+
     # Print header
     print(f"\n{color('claude-dotfiles validator', Colors.BOLD)}\n")
 
     # -------------------------------------------------------------------------
     # Determine validation target
     # -------------------------------------------------------------------------
-    if len(sys.argv) > 1:
+    if args.path:
         # User specified a path
-        target = Path(sys.argv[1])
+        target = Path(args.path)
     else:
         # Default: validate the repo root (parent of scripts/ directory)
         target = Path(__file__).parent.parent
@@ -950,7 +1562,9 @@ def main():
         files_checked = 1
     else:
         info(f"Validating directory: {target}")
-        files_checked, errors, warnings = validate_directory(target)
+        files_checked, errors, warnings = validate_directory(
+            target, skip_unchanged=args.skip_unchanged,
+            read_ahead=args.read_ahead)
 
     # -------------------------------------------------------------------------
     # Print summary
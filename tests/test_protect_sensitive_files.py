@@ -1,20 +1,29 @@
 #!/usr/bin/env python3
-# ABOUTME: Unit tests for hooks/validators/protect-sensitive-files.py
-# ABOUTME: Verifies stdin JSON reading and fail-closed behavior on missing paths.
+# ABOUTME: Unit tests for hooks/validators/protect-sensitive-files.{py,sh}
+# ABOUTME: Verifies stdin JSON reading, fail-closed behavior, and py/sh parity.
 
+import fnmatch
+import importlib.util
 import json
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 SCRIPT = ROOT / "hooks" / "validators" / "protect-sensitive-files.py"
+SH_SCRIPT = ROOT / "hooks" / "validators" / "protect-sensitive-files.sh"
 
+spec = importlib.util.spec_from_file_location("protect_sensitive_files", SCRIPT)
+psf = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(psf)
 
-def run(stdin: str) -> tuple[int, str]:
+
+def run(stdin: str, command: list[str] | None = None) -> tuple[int, str]:
     """Invoke the hook, returning (exit_code, stderr)."""
     result = subprocess.run(
-        ["python3", str(SCRIPT)],
+        command or ["python3", str(SCRIPT)],
         input=stdin,
         text=True,
         capture_output=True,
@@ -42,6 +51,56 @@ def test_ssh_key_blocked():
     expect(".ssh/id_rsa blocked", code, 1)
 
 
+def test_wildcard_pattern_blocked():
+    stdin = json.dumps({"tool_input": {"file_path": "/srv/tls/server.pem"}})
+    code, err = run(stdin)
+    expect("*.pem blocked", code, 1)
+    if "'*.pem'" not in err:
+        print(f"FAIL: expected '*.pem' in reason, got {err!r}")
+        sys.exit(1)
+
+
+def test_trailing_slash_blocked():
+    # The basename is the last non-empty component, as with Path.name
+    for path in ("/app/x.pem/", "/app/a.key/", "/app/.env//"):
+        stdin = json.dumps({"tool_input": {"file_path": path}})
+        code, _ = run(stdin)
+        expect(f"{path} blocked", code, 1)
+
+
+def test_path_fragment_glob_blocked():
+    stdin = json.dumps({"tool_input": {"file_path": "/home/u/.config/gcloud/sa-key.json"}})
+    code, _ = run(stdin)
+    expect("gcloud/*.json blocked", code, 1)
+
+
+def test_directory_match_is_component_exact():
+    # ".github" must not be caught by the ".git" directory rule
+    stdin = json.dumps({"tool_input": {"file_path": "/repo/.github/workflows/ci.yml"}})
+    code, _ = run(stdin)
+    expect(".github not mistaken for .git", code, 0)
+
+    stdin = json.dumps({"tool_input": {"file_path": ".git/config"}})
+    code, _ = run(stdin)
+    expect("relative .git/config blocked", code, 1)
+
+
+def test_path_and_bytes_arguments():
+    # Importers may hand is_protected() a Path or bytes instead of a str
+    cases = [
+        (Path("/home/user/.ssh/id_rsa"), True),
+        (b"/srv/tls/server.pem", True),
+        (b"C:\\Users\\me\\.env", True),
+        (Path("/home/user/project/main.py"), False),
+    ]
+    for path, want in cases:
+        got, _ = psf.is_protected(path)
+        if got != want:
+            print(f"FAIL: is_protected({path!r}) -> {got}, expected {want}")
+            sys.exit(1)
+    print("  Path and bytes arguments: PASS")
+
+
 def test_safe_file_allowed():
     stdin = json.dumps({"tool_input": {"file_path": "/home/user/project/main.py"}})
     code, _ = run(stdin)
@@ -79,13 +138,89 @@ def test_no_stdin_fails_closed():
     print("  empty stdin fails closed: PASS (exit 1)")
 
 
+def test_glob_regex_matches_patterns():
+    derived = "|".join(f"({fnmatch.translate(p)})" for p in psf._GLOB_PATTERNS)
+    derived = derived.replace("[\\s\\S]", "(?s:.)")
+    if derived != psf._GLOB_RE_SRC:
+        print("FAIL: _GLOB_RE_SRC is stale; regenerate it from _GLOB_PATTERNS")
+        print(f"  expected: {derived!r}")
+        sys.exit(1)
+    print("  frozen glob regex matches PROTECTED_PATTERNS: PASS")
+
+
+def test_sh_port_lists_match_python():
+    # The Python hook is the source of truth for the policy; the sh port
+    # carries a copy that must match it entry for entry.
+    text = SH_SCRIPT.read_text(encoding="utf-8")
+    for var, expected in (("PROTECTED_PATTERNS", psf.PROTECTED_PATTERNS),
+                          ("PROTECTED_DIRECTORIES", psf.PROTECTED_DIRECTORIES)):
+        m = re.search(rf'^{var}="([^"]*)"', text, re.MULTILINE)
+        actual = m.group(1).split() if m else None
+        if actual != expected:
+            print(f"FAIL: {var} in {SH_SCRIPT.name} is out of sync with the Python hook")
+            print(f"  expected: {expected}")
+            print(f"  actual:   {actual}")
+            sys.exit(1)
+    print("  sh port pattern lists match Python: PASS")
+
+
+def test_sh_port_matches_python():
+    if not shutil.which("jq"):
+        print("  sh port parity: SKIP (jq not installed)")
+        return
+    payloads = [json.dumps({"tool_input": {"file_path": p}}) for p in (
+        "/home/user/.env",
+        "/app/.env.production",
+        "/app/.envrc",
+        "/home/u/.ssh/id_rsa",
+        "/home/u/keys/id_rsa.pub",
+        "/srv/tls/server.pem",
+        "/home/u/.docker/config.json",
+        "/home/u/.config/gcloud/sa-key.json",
+        "/repo/.git/config",
+        "/repo/.github/workflows/ci.yml",
+        "C:\\Users\\u\\project\\.env",
+        "C:\\Users\\u\\project\\main.py",
+        "/x/it's a \"quoted\" path/main.py",
+        "/home/user/project/main.py",
+        "/app/x.pem/",
+        "/app/a.key//",
+        "/app/src/",
+        "/",
+    )]
+    # Malformed payloads only need the same verdict; the parser error
+    # details naturally differ between json and jq.
+    malformed = ["", "not valid json", "{}", '{"tool_input": {"file_path": ""}}',
+                 # Several documents: a later safe path must not mask a
+                 # protected earlier one
+                 '{"tool_input":{"file_path":".env"}}{"tool_input":{"file_path":"README.md"}}',
+                 '{"tool_input":{"file_path":"README.md"}}\n{"tool_input":{"file_path":"main.py"}}']
+    for stdin in payloads + malformed:
+        want = run(stdin)
+        got = run(stdin, ["sh", str(SH_SCRIPT)])
+        if stdin in malformed:
+            want, got = want[0], got[0]
+        if got != want:
+            print(f"FAIL: sh port differs for {stdin!r}: python={want!r} sh={got!r}")
+            sys.exit(1)
+    print(f"  sh port parity: PASS ({len(payloads) + len(malformed)} payloads)")
+
+
 if __name__ == "__main__":
     print("tests/test_protect_sensitive_files.py")
     test_sensitive_file_blocked()
     test_ssh_key_blocked()
+    test_wildcard_pattern_blocked()
+    test_trailing_slash_blocked()
+    test_path_fragment_glob_blocked()
+    test_directory_match_is_component_exact()
+    test_path_and_bytes_arguments()
     test_safe_file_allowed()
     test_empty_path_fails_closed()
     test_missing_tool_input_fails_closed()
     test_malformed_stdin_fails_closed()
     test_no_stdin_fails_closed()
+    test_glob_regex_matches_patterns()
+    test_sh_port_lists_match_python()
+    test_sh_port_matches_python()
     print("  all: PASS")
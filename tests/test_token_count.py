@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # ABOUTME: Unit tests for scripts/token-count.py helper functions.
-# ABOUTME: Verifies that comma-formatted token counts are parsed correctly.
+# ABOUTME: Verifies header token counts parse correctly, including commas.
 
 import importlib.util
 import sys
@@ -41,6 +41,26 @@ def test_no_tilde():
     assert_eq("no tilde", tc.extract_existing_token_comment(content), 500)
 
 
+def test_header_after_title():
+    content = "# Example\n\nIntro text.\n\n<!-- Tokens: ~1,350 (target: 1,500) -->\n"
+    assert_eq("header after short title", tc.extract_existing_token_comment(content), 1350)
+
+
+def test_quoted_in_body_ignored():
+    # Documentation that shows the header format far below the top
+    content = "# Guide\n" + "Body text.\n" * 100 + "<!-- Tokens: ~1,450 -->\n"
+    assert_eq("example deep in body ignored", tc.extract_existing_token_comment(content), None)
+
+
+def test_header_straddling_window():
+    # A header that starts inside the search window but ends past it
+    for offset in (496, tc.HEADER_SEARCH_CHARS - 1):
+        content = "x" * offset + "<!-- Tokens: ~1,400 -->\n# Doc"
+        assert_eq(f"header at offset {offset}", tc.extract_existing_token_comment(content), 1400)
+    content = "x" * tc.HEADER_SEARCH_CHARS + "<!-- Tokens: ~1,400 -->\n"
+    assert_eq("header just past window", tc.extract_existing_token_comment(content), None)
+
+
 def test_absent():
     content = "# Doc with no token header"
     assert_eq("absent header", tc.extract_existing_token_comment(content), None)
@@ -52,5 +72,8 @@ if __name__ == "__main__":
     test_comma_formatted()
     test_comma_formatted_large()
     test_no_tilde()
+    test_header_after_title()
+    test_quoted_in_body_ignored()
+    test_header_straddling_window()
     test_absent()
     print("  all: PASS")
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# ABOUTME: Unit tests for scripts/validate.py directory validation.
+# ABOUTME: Checks error/warning reporting on a fixture tree, serial and pooled.
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / "scripts" / "validate.py"
+
+spec = importlib.util.spec_from_file_location("validate", SCRIPT)
+val = importlib.util.module_from_spec(spec)
+# Registered so worker processes can pickle validate._validate_task
+sys.modules["validate"] = val
+spec.loader.exec_module(val)
+
+BODY = "Body text that is long enough to pass the minimum length checks. " * 4
+
+
+def assert_eq(label, actual, expected):
+    if actual != expected:
+        print(f"FAIL: {label}: expected {expected!r}, got {actual!r}")
+        sys.exit(1)
+    print(f"  {label}: PASS")
+
+
+def make_tree(root: Path) -> None:
+    """Build a small repo with one problem of each kind."""
+    (root / "good.json").write_text('{"// NOTE": "comment", "a": 1}\n')
+    (root / "bad.json").write_text('{"a": 1,}\n')
+
+    good = root / "skills" / "good"
+    good.mkdir(parents=True)
+    (good / "SKILL.md").write_text(
+        f"---\nname: good\ndescription: |\n  A good skill.\n---\n\n# Good\n\n{BODY}\n"
+    )
+    bad = root / "skills" / "bad"
+    bad.mkdir(parents=True)
+    (bad / "SKILL.md").write_text(
+        f"---\nname: Bad_Name\n---\n\n# Bad\n\n{BODY}\n"
+    )
+
+    (root / "rules").mkdir()
+    (root / "rules" / "short.md").write_text("no heading\n")
+
+    (root / "agents").mkdir()
+    (root / "agents" / "helper.md").write_text(
+        f"---\nname: helper\ndescription: Helps.\n---\n\n{BODY}\n"
+    )
+
+    (root / "README.md").write_text(
+        "# Fixture\n\n[ok](./good.json) [gone](./missing.md)\n"
+        # Directories and targets outside the validated tree also count
+        "[dir](./skills/good/) [root](/rules) [outside](../)\n"
+        "```\n[example](./also-missing.md)\n```\n"
+    )
+
+
+def run_directory(root: Path, min_tasks: int, skip_unchanged: bool = False):
+    """Validate root with the given pool threshold; return (counts, output)."""
+    saved = val.PARALLEL_MIN_TASKS
+    val.PARALLEL_MIN_TASKS = min_tasks
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            counts = val.validate_directory(root, skip_unchanged)
+    finally:
+        val.PARALLEL_MIN_TASKS = saved
+    return counts, out.getvalue()
+
+
+def test_directory_counts():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        assert_eq("empty tree counts", run_directory(root, sys.maxsize)[0], (0, 0, 0))
+
+        make_tree(root)
+        counts, output = run_directory(root, sys.maxsize)
+        # 2 json + 2 skills + 1 rule + 1 agent checked; the link pass only warns.
+        # Errors: bad.json, bad skill (name format + missing description),
+        # short rule (no heading + too short)
+        assert_eq("fixture counts", counts, (6, 5, 1))
+        assert_eq("broken link reported",
+                  "README.md: Broken link: [gone](./missing.md)" in output, True)
+        assert_eq("fenced link ignored", "also-missing" in output, False)
+
+
+def test_dotdot_links():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "docs").mkdir()
+        (root / "docs" / "guide.md").write_text("# Guide\n")
+        (root / "README.md").write_text(
+            "[up](docs/../README.md) [gone](missing/../README.md)\n"
+        )
+        counts, output = run_directory(root, sys.maxsize)
+        assert_eq("'..' through a real dir resolves", "[up]" in output, False)
+        assert_eq("'..' through a missing dir is broken",
+                  "README.md: Broken link: [gone](missing/../README.md)" in output, True)
+        assert_eq("dotdot link counts", counts, (0, 0, 1))
+
+
+def test_dangling_symlink_link():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "dead").symlink_to("nowhere")
+        (root / "live").symlink_to("README.md")
+        (root / "README.md").write_text("[l](./dead) [ok](./live)\n")
+        counts, output = run_directory(root, sys.maxsize)
+        assert_eq("dangling symlink link is broken",
+                  "README.md: Broken link: [l](./dead)" in output, True)
+        assert_eq("live symlink link resolves", "[ok]" in output, False)
+        assert_eq("symlink link counts", counts, (0, 0, 1))
+
+
+def test_pool_matches_serial():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        serial = run_directory(root, sys.maxsize)
+        pooled = run_directory(root, 0)
+        assert_eq("process pool output matches serial", pooled, serial)
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            counts = val.validate_directory(root, read_ahead=True)
+        assert_eq("read-ahead output matches serial", (counts, out.getvalue()), serial)
+
+
+def test_skip_unchanged():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        first = run_directory(root, sys.maxsize, skip_unchanged=True)
+        assert_eq("cache file written", (root / val.CACHE_FILENAME).exists(), True)
+        assert_eq("no temporary cache files left",
+                  list(root.glob(val.CACHE_FILENAME + ".*.tmp")), [])
+
+        # Record which checks actually run on the second run
+        ran = []
+        original = val._run_check
+
+        def recording(kind, path, content, repo_root):
+            ran.append((kind, path.name))
+            return original(kind, path, content, repo_root)
+
+        (root / "good.json").write_text('{"a": 1,}\n')
+        val._run_check = recording
+        try:
+            counts, output = run_directory(root, sys.maxsize, skip_unchanged=True)
+        finally:
+            val._run_check = original
+
+        assert_eq("first cached run counts", first[0], (6, 5, 1))
+        assert_eq("changed file re-validated", ("json", "good.json") in ran, True)
+        assert_eq("failing file re-validated", ("json", "bad.json") in ran, True)
+        assert_eq("unchanged passing file skipped", ("agent", "helper.md") in ran, False)
+        assert_eq("links always checked", ("links", "README.md") in ran, True)
+        # Still 6 checked: the cache file itself is not validated as JSON
+        assert_eq("counts after edit", counts, (6, 6, 1))
+        assert_eq("cached pass still reported", "agents/helper.md" in output, True)
+
+
+def test_crlf_and_unreadable():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        skill = root / "skills" / "crlf"
+        skill.mkdir(parents=True)
+        text = f"---\nname: crlf\ndescription: Windows line endings.\n---\n\n# CRLF\n\n{BODY}\n"
+        (skill / "SKILL.md").write_bytes(text.replace("\n", "\r\n").encode())
+        (root / "latin1.json").write_bytes(b'{"caf\xe9": 1}')
+
+        counts, output = run_directory(root, sys.maxsize)
+        assert_eq("CRLF skill passes, undecodable JSON fails", counts, (2, 1, 0))
+        assert_eq("read error reported", "latin1.json: Error reading file:" in output, True)
+
+
+def test_deeply_nested_json():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        # Deep enough that json.loads() raises RecursionError
+        (root / "deep.json").write_text("[" * 100000 + "]" * 100000)
+
+        saved = val.ORJSON_AVAILABLE
+        val.ORJSON_AVAILABLE = False
+        try:
+            serial = run_directory(root, sys.maxsize)
+            pooled = run_directory(root, 0)
+        finally:
+            val.ORJSON_AVAILABLE = saved
+        assert_eq("nested JSON reported as an error", serial[0], (1, 1, 0))
+        assert_eq("nested JSON error message",
+                  "deep.json: Error reading file:" in serial[1], True)
+        assert_eq("nested JSON pooled matches serial", pooled, serial)
+
+
+def test_body_after_spaced_delimiter():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        skill = root / "skills" / "spaced"
+        skill.mkdir(parents=True)
+        # Closing --- with trailing spaces still ends the frontmatter, so the
+        # short body after it must be measured
+        (skill / "SKILL.md").write_text(
+            "---\nname: spaced\ndescription: Trailing spaces.\n---   \n\nToo short.\n"
+        )
+        counts, output = run_directory(root, sys.maxsize)
+        assert_eq("short body after spaced delimiter", counts, (1, 1, 0))
+        assert_eq("body error reported", "body seems too short" in output, True)
+
+
+def test_pruned_dirs():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in ("node_modules/pkg", ".git", ".github"):
+            (root / name).mkdir(parents=True)
+        (root / "node_modules" / "pkg" / "package.json").write_text("{,}\n")
+        (root / "node_modules" / "pkg" / "README.md").write_text("[x](./gone.md)\n")
+        (root / ".git" / "bad.json").write_text("{,}\n")
+        # Only whole directory names are pruned, not names containing ".git"
+        (root / ".github" / "config.json").write_text("{}\n")
+
+        counts, output = run_directory(root, sys.maxsize)
+        assert_eq("pruned dirs not validated", counts, (1, 0, 0))
+        assert_eq(".github json checked", ".github/config.json" in output, True)
+
+
+def test_json_fast_path():
+    # With or without orjson, validate_json must give the same answers
+    samples = [b'{"a": 1}', b'{"a": 1,}', b'{"a": NaN}',
+               b'{"a": 123456789012345678901234567890}', b'{"caf\xe9": 1}',
+               # Shallow enough for the fast path, and too deep for json.loads
+               b'[' * 400 + b']' * 400, b'[' * 100000 + b']' * 100000]
+    saved = val.ORJSON_AVAILABLE
+    try:
+        fast = [val.validate_json(None, data) for data in samples]
+        val.ORJSON_AVAILABLE = False
+        plain = [val.validate_json(None, data) for data in samples]
+    finally:
+        val.ORJSON_AVAILABLE = saved
+    assert_eq("orjson fast path matches json", fast, plain)
+
+
+if __name__ == "__main__":
+    print("tests/test_validate.py")
+    test_directory_counts()
+    test_dotdot_links()
+    test_dangling_symlink_link()
+    test_pool_matches_serial()
+    test_skip_unchanged()
+    test_crlf_and_unreadable()
+    test_deeply_nested_json()
+    test_body_after_spaced_delimiter()
+    test_pruned_dirs()
+    test_json_fast_path()
+    print("  all: PASS")